@@ -4,129 +4,266 @@ Advanced YAML Cleanup for Kubernetes Resources
 Comprehensive cleanup of all Kubernetes-generated fields
 """
 
+import fnmatch
+import hashlib
+import json
+import logging
+import os
+import shutil
 import yaml
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Final, FrozenSet, Iterator, List, Optional, Tuple
+
+# Prefer the libyaml C bindings when PyYAML was built with them - the C
+# parser/emitter is an order of magnitude faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# orjson is optional; its SIMD-accelerated encoder makes the JSON output
+# path several times faster than yaml.dump_all for plain-data manifests
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Module logger; silent by default so hot loops (and parallel workers) do
+# not serialize on stdout - callers opt in via logging.basicConfig
+log = logging.getLogger(__name__)
+
+# Sentinel used to detect whether dict.pop actually removed a key
+_SENTINEL = object()
+
+def _walk_yaml_files(dirpath, pattern: str, recursive: bool) -> Iterator[Path]:
+    """Yield matching files using os.scandir's cached entry types
+
+    Avoids the per-entry Path construction and extra stat() that
+    rglob + is_file() incur on large trees.
+    """
+    with os.scandir(dirpath) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    yield from _walk_yaml_files(entry.path, pattern, recursive)
+            elif entry.is_file(follow_symlinks=False) and fnmatch.fnmatch(entry.name, pattern):
+                yield Path(entry.path)
 
 class KubernetesYAMLCleaner:
     """Advanced Kubernetes YAML cleaner with comprehensive field removal"""
     
     # Metadata fields that should NEVER be in GitOps
-    METADATA_BLACKLIST = {
+    METADATA_BLACKLIST: Final[FrozenSet[str]] = frozenset({
         'uid', 'resourceVersion', 'generation', 'creationTimestamp',
         'deletionTimestamp', 'deletionGracePeriodSeconds', 'managedFields',
         'selfLink', 'finalizers', 'ownerReferences'
-    }
+    })
     
     # Annotation keys that should be removed (Kubernetes-generated)
-    ANNOTATION_BLACKLIST = {
+    ANNOTATION_BLACKLIST: Final[FrozenSet[str]] = frozenset({
         'kubectl.kubernetes.io/last-applied-configuration',
-        'deployment.kubernetes.io/revision', 
+        'deployment.kubernetes.io/revision',
         'control-plane.alpha.kubernetes.io/leader',
         'pv.kubernetes.io/bind-completed',
         'pv.kubernetes.io/bound-by-controller',
         'volume.beta.kubernetes.io/storage-provisioner',
         'volume.kubernetes.io/storage-provisioner'
-    }
+    })
     
     # Label keys that should be removed (Kubernetes-generated)
-    LABEL_BLACKLIST = {
+    LABEL_BLACKLIST: Final[FrozenSet[str]] = frozenset({
         'pod-template-hash',
         'controller-revision-hash',
         'statefulset.kubernetes.io/pod-name'
-    }
+    })
     
+    # ConfigMap/Secret data keys that look Kubernetes-generated; the names
+    # are exact so plain set membership beats regex matching
+    _GENERATED_DATA_KEYS = frozenset({'ca.crt', 'service-ca.crt', 'ca-bundle.crt'})
+
     # Resource-specific fields to remove
-    RESOURCE_SPECIFIC_CLEANUP = {
+    RESOURCE_SPECIFIC_CLEANUP: Final[Dict[str, Dict[str, Tuple[str, ...]]]] = {
         'Service': {
-            'spec': ['clusterIP', 'clusterIPs', 'internalTrafficPolicy', 'externalTrafficPolicy']
+            'spec': ('clusterIP', 'clusterIPs', 'internalTrafficPolicy', 'externalTrafficPolicy')
         },
         'PersistentVolumeClaim': {
-            'spec': ['volumeName'],
-            'metadata': ['finalizers']
+            'spec': ('volumeName',),
+            'metadata': ('finalizers',)
         },
         'Deployment': {
-            'spec': ['revisionHistoryLimit'],  # Keep this configurable
-            'metadata': ['generation']
+            'spec': ('revisionHistoryLimit',),  # Keep this configurable
+            'metadata': ('generation',)
         },
         'Pod': {
-            'spec': ['nodeName', 'serviceAccount'],  # serviceAccount auto-generated
-            'metadata': ['generateName']
+            'spec': ('nodeName', 'serviceAccount'),  # serviceAccount auto-generated
+            'metadata': ('generateName',)
         },
         'ReplicaSet': {
-            'metadata': ['ownerReferences']  # Already in general blacklist
+            'metadata': ('ownerReferences',)  # Already in general blacklist
         }
     }
 
-    def __init__(self, preserve_fields: Optional[List[str]] = None):
+    def __init__(self, preserve_fields: Optional[List[str]] = None,
+                 cache_cleaned: bool = False):
         """
         Initialize cleaner with optional field preservation
-        
+
         Args:
             preserve_fields: List of fields to preserve even if blacklisted
+            cache_cleaned: Write a JSON sidecar of the cleaned documents so
+                repeated validate_cleanup runs skip the YAML parse
         """
         self.preserve_fields = set(preserve_fields or [])
+        self.cache_cleaned = cache_cleaned
+
+        # Maps (content hash, output format) -> serialized cleaned bytes
+        # (None = file was already clean). K8s dumps are full of duplicated
+        # manifests (Helm ConfigMaps, per-namespace CRDs); identical inputs
+        # share one parse+clean+dump
+        self._result_cache: Dict[Tuple[bytes, str], Optional[bytes]] = {}
+
+        # Set by clean_document whenever cleaning actually removed a field;
+        # lets clean_yaml_file skip re-serializing already-clean files
+        self._dirty = False
+
+        # Precompute effective blacklists with preserve_fields subtracted so
+        # the per-document cleanup loops skip the membership check entirely
+        self._metadata_blacklist = self.METADATA_BLACKLIST - self.preserve_fields
+        self._annotation_blacklist = self.ANNOTATION_BLACKLIST - self.preserve_fields
+        self._label_blacklist = self.LABEL_BLACKLIST - self.preserve_fields
+        self._spec_blacklist = {
+            kind: frozenset(rules.get('spec', ())) - self.preserve_fields
+            for kind, rules in self.RESOURCE_SPECIFIC_CLEANUP.items()
+        }
+
+        # Kind-specific handlers dispatched via one dict lookup instead of
+        # the old if/elif chain over every document
+        self._kind_handlers = {
+            'Service': self._cleanup_service,
+            'PersistentVolumeClaim': self._cleanup_pvc,
+            'Deployment': self._cleanup_deployment,
+            'ConfigMap': self._cleanup_configmap_secret,
+            'Secret': self._cleanup_configmap_secret,
+        }
     
-    def clean_yaml_file(self, file_path: Path, backup: bool = False) -> bool:
+    def clean_yaml_file(self, file_path: Path, backup: bool = False,
+                        output_format: str = 'yaml') -> bool:
         """
         Clean a single YAML file
-        
+
         Args:
             file_path: Path to YAML file
             backup: Create .backup file before cleaning
-            
+            output_format: 'yaml' (default, block style) or 'json' - JSON is
+                a strict YAML subset that Kubernetes accepts and emits
+                several times faster for plain-data manifests
+
         Returns:
             bool: True if cleaned successfully, False otherwise
         """
         try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+
+            # Cheap pre-filter: if the leading bytes contain no Kubernetes
+            # markers there is nothing for us to clean, so skip the (much
+            # more expensive) YAML parse entirely
+            head = raw[:8192]
+            if b'apiVersion' not in head and b'kind:' not in head:
+                log.info("⏭️  Skipping non-Kubernetes file: %s", file_path.name)
+                return True
+
             # Create backup if requested
             if backup:
                 backup_path = file_path.with_suffix(f"{file_path.suffix}.backup")
-                backup_path.write_text(file_path.read_text())
-                print(f"💾 Created backup: {backup_path}")
-            
-            # Load all documents from file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                try:
-                    docs = list(yaml.safe_load_all(f))
-                except yaml.YAMLError as e:
-                    print(f"⚠️  YAML parsing error in {file_path}: {e}")
-                    return False
-            
-            # Clean each document
+                shutil.copyfile(file_path, backup_path)
+                log.info("💾 Created backup: %s", backup_path)
+
+            # Duplicate inputs (same bytes) reuse the previous clean result
+            cache_key = (hashlib.blake2b(raw, digest_size=16).digest(), output_format)
+            if cache_key in self._result_cache:
+                cached = self._result_cache[cache_key]
+                if cached is None:
+                    log.info("✨ No changes needed for %s (cached)", file_path)
+                else:
+                    self._replace_with_bytes(file_path, cached)
+                    log.info("✅ Successfully cleaned %s (cached)", file_path)
+                return True
+
+            # Stream documents from the buffer, cleaning one at a time so
+            # only the cleaned documents are ever held in memory
             cleaned_docs = []
-            for i, doc in enumerate(docs):
-                if not doc:  # Skip empty documents
-                    continue
-                
-                cleaned_doc = self.clean_document(doc)
-                if cleaned_doc:
-                    cleaned_docs.append(cleaned_doc)
-                    print(f"🧹 Cleaned document {i+1} in {file_path.name}")
-            
+            file_dirty = False
+            try:
+                for i, doc in enumerate(yaml.load_all(raw, Loader=SafeLoader)):
+                    if not doc:  # Skip empty documents
+                        continue
+
+                    cleaned_doc = self.clean_document(doc)
+                    if self._dirty:
+                        file_dirty = True
+                    if cleaned_doc:
+                        cleaned_docs.append(cleaned_doc)
+                        log.info("🧹 Cleaned document %d in %s", i + 1, file_path.name)
+            except yaml.YAMLError as e:
+                log.warning("⚠️  YAML parsing error in %s: %s", file_path, e)
+                return False
+
             if not cleaned_docs:
-                print(f"⚠️  No valid documents found in {file_path}")
+                log.warning("⚠️  No valid documents found in %s", file_path)
                 return False
-            
-            # Write cleaned documents back
-            with open(file_path, 'w', encoding='utf-8') as f:
-                yaml.dump_all(
-                    cleaned_docs, 
-                    f, 
-                    default_flow_style=False, 
-                    sort_keys=False,
-                    allow_unicode=True,
-                    width=120,
-                    indent=2
-                )
-            
-            print(f"✅ Successfully cleaned {file_path}")
+
+            # Nothing was removed - skip the dump and rewrite so clean files
+            # keep their mtime (re-runs, git status) untouched
+            if not file_dirty:
+                log.info("✨ No changes needed for %s", file_path)
+                self._result_cache[cache_key] = None
+                self._write_doc_cache(file_path, cleaned_docs)
+                return True
+
+            out_bytes = self._serialize_docs(cleaned_docs, output_format)
+            self._replace_with_bytes(file_path, out_bytes)
+            self._result_cache[cache_key] = out_bytes
+            self._write_doc_cache(file_path, cleaned_docs)
+
+            log.info("✅ Successfully cleaned %s", file_path)
             return True
-            
+
         except Exception as e:
-            print(f"❌ Error cleaning {file_path}: {e}")
+            log.error("❌ Error cleaning %s: %s", file_path, e)
             return False
+
+    @staticmethod
+    def _replace_with_bytes(file_path: Path, data: bytes) -> None:
+        """Atomically replace file_path's contents via a sibling temp file
+
+        A failed write never truncates the original, and parallel workers
+        can safely retry a file.
+        """
+        tmp_path = file_path.with_suffix(f"{file_path.suffix}.tmp")
+        try:
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    def _serialize_docs(self, docs: List[Dict[str, Any]], output_format: str) -> bytes:
+        """Serialize cleaned documents to bytes in the requested format"""
+        if output_format == 'json':
+            return self._dump_json(docs)
+        return yaml.dump_all(
+            docs,
+            Dumper=SafeDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+            width=120,
+            indent=2
+        ).encode('utf-8')
     
     def clean_document(self, doc: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -138,30 +275,46 @@ class KubernetesYAMLCleaner:
         Returns:
             Cleaned document or None if invalid
         """
-        if not isinstance(doc, dict):
+        # Reset before any return: cleaner instances are reused across files,
+        # so an early-out must not leak the previous document's dirty state
+        self._dirty = False
+
+        # Plain dicts are the only thing the YAML loader produces here, so
+        # an exact type check beats the isinstance MRO walk
+        if type(doc) is not dict:
             return None
-        
-        # Skip documents without basic K8s structure
-        if 'apiVersion' not in doc or 'kind' not in doc:
-            print("⚠️  Skipping non-Kubernetes document")
+
+        # Skip documents without basic K8s structure; single get per key
+        # instead of separate membership + lookup passes
+        kind = doc.get('kind')
+        if kind is None or doc.get('apiVersion') is None:
+            log.info("⚠️  Skipping non-Kubernetes document")
             return doc  # Return as-is, might be config file
-        
-        kind = doc.get('kind', '')
-        
+
         # 1. Remove status section entirely
-        doc.pop('status', None)
-        
+        if doc.pop('status', _SENTINEL) is not _SENTINEL:
+            self._dirty = True
+
         # 2. Clean metadata
-        if 'metadata' in doc:
-            doc['metadata'] = self._clean_metadata(doc['metadata'])
-        
-        # 3. Clean spec based on resource type
-        if 'spec' in doc and kind in self.RESOURCE_SPECIFIC_CLEANUP:
-            doc['spec'] = self._clean_spec(doc['spec'], kind)
-        
-        # 4. Resource-specific cleaning
-        doc = self._resource_specific_cleanup(doc, kind)
-        
+        metadata = doc.get('metadata')
+        if metadata is not None:
+            doc['metadata'] = self._clean_metadata(metadata)
+
+        # 3. Clean spec based on resource type; inlined so the common case
+        # (kind with no spec rules) costs one dict lookup and no call
+        rules = self._spec_blacklist.get(kind)
+        if rules:
+            spec = doc.get('spec')
+            if type(spec) is dict:
+                for field in rules:
+                    if spec.pop(field, _SENTINEL) is not _SENTINEL:
+                        self._dirty = True
+
+        # 4. Resource-specific cleaning via O(1) kind dispatch
+        handler = self._kind_handlers.get(kind)
+        if handler is not None:
+            handler(doc)
+
         return doc
     
     def _clean_metadata(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -170,126 +323,149 @@ class KubernetesYAMLCleaner:
             return metadata
         
         # Remove blacklisted fields
-        for field in self.METADATA_BLACKLIST:
-            if field not in self.preserve_fields:
-                metadata.pop(field, None)
-        
+        for field in self._metadata_blacklist:
+            if metadata.pop(field, _SENTINEL) is not _SENTINEL:
+                self._dirty = True
+
         # Clean annotations
         if 'annotations' in metadata and metadata['annotations']:
             metadata['annotations'] = self._clean_dict(
-                metadata['annotations'], 
-                self.ANNOTATION_BLACKLIST
+                metadata['annotations'],
+                self._annotation_blacklist
             )
             # Remove empty annotations dict
             if not metadata['annotations']:
                 metadata.pop('annotations', None)
-        
-        # Clean labels  
+
+        # Clean labels
         if 'labels' in metadata and metadata['labels']:
             metadata['labels'] = self._clean_dict(
                 metadata['labels'],
-                self.LABEL_BLACKLIST
+                self._label_blacklist
             )
         
         return metadata
     
-    def _clean_spec(self, spec: Dict[str, Any], kind: str) -> Dict[str, Any]:
-        """Clean spec section based on resource kind"""
-        if not isinstance(spec, dict):
-            return spec
-        
-        if kind in self.RESOURCE_SPECIFIC_CLEANUP:
-            cleanup_rules = self.RESOURCE_SPECIFIC_CLEANUP[kind]
-            if 'spec' in cleanup_rules:
-                for field in cleanup_rules['spec']:
-                    if field not in self.preserve_fields:
-                        spec.pop(field, None)
-        
-        return spec
-    
     def _clean_dict(self, d: Dict[str, Any], blacklist: set) -> Dict[str, Any]:
-        """Remove blacklisted keys from dictionary"""
+        """Remove blacklisted keys from dictionary in place"""
         if not isinstance(d, dict):
             return d
-        
-        return {k: v for k, v in d.items() if k not in blacklist}
+
+        # Only touch the (typically 0-1) blacklisted keys instead of
+        # rebuilding the whole dict; insertion order is preserved
+        for key in blacklist & d.keys():
+            del d[key]
+            self._dirty = True
+
+        return d
     
-    def _resource_specific_cleanup(self, doc: Dict[str, Any], kind: str) -> Dict[str, Any]:
-        """Perform resource-specific cleanup"""
-        
-        # Service-specific cleanup
-        if kind == 'Service':
-            spec = doc.get('spec', {})
-            # Remove auto-assigned cluster IPs
-            spec.pop('clusterIP', None)
-            spec.pop('clusterIPs', None)
-            # Remove health check node port for LoadBalancer
-            if spec.get('type') == 'LoadBalancer':
-                spec.pop('healthCheckNodePort', None)
-        
-        # PVC-specific cleanup
-        elif kind == 'PersistentVolumeClaim':
-            spec = doc.get('spec', {})
-            # Remove volume name (bound by controller)
-            spec.pop('volumeName', None)
-            # Remove volume mode if default
-            if spec.get('volumeMode') == 'Filesystem':
-                spec.pop('volumeMode', None)
-        
-        # Deployment-specific cleanup
-        elif kind == 'Deployment':
-            spec = doc.get('spec', {})
-            # Remove observed generation
-            spec.pop('observedGeneration', None)
-            # Clean template metadata
-            if 'template' in spec and 'metadata' in spec['template']:
-                spec['template']['metadata'] = self._clean_metadata(
-                    spec['template']['metadata']
-                )
-        
-        # ConfigMap/Secret specific
-        elif kind in ['ConfigMap', 'Secret']:
-            # Remove data keys that look like Kubernetes-generated
-            data = doc.get('data', {})
-            generated_patterns = [
-                r'ca\.crt$',
-                r'service-ca\.crt$',
-                r'ca-bundle\.crt$'
-            ]
-            
-            keys_to_check = list(data.keys())
-            for key in keys_to_check:
-                for pattern in generated_patterns:
-                    if re.match(pattern, key):
-                        print(f"🔍 Found potential generated data key: {key} (keeping)")
-                        break
-        
-        return doc
+    def _pop_tracked(self, d: Dict[str, Any], key: str) -> None:
+        """Remove a key, marking the document dirty if it was present"""
+        if d.pop(key, _SENTINEL) is not _SENTINEL:
+            self._dirty = True
+
+    @staticmethod
+    def _dump_json(docs: List[Dict[str, Any]]) -> bytes:
+        """Encode documents as JSON, one body per document
+
+        Multi-document files are emitted as a ---separated stream of JSON
+        bodies — still a valid YAML document stream — rather than one bare
+        top-level array, which kubectl would reject as a manifest.
+        """
+        if orjson is not None:
+            bodies = [orjson.dumps(doc, option=orjson.OPT_INDENT_2) for doc in docs]
+        else:
+            bodies = [json.dumps(doc, indent=2, default=str).encode('utf-8') for doc in docs]
+        return b'\n---\n'.join(bodies)
+
+    @staticmethod
+    def _cache_path(file_path: Path) -> Path:
+        """Sidecar path holding the cleaned documents as JSON"""
+        return file_path.with_name(f"{file_path.name}.cache.json")
+
+    def _write_doc_cache(self, file_path: Path, docs: List[Dict[str, Any]]) -> None:
+        """Persist cleaned documents so validation can skip the YAML parse"""
+        if not self.cache_cleaned:
+            return
+        try:
+            cache_path = self._cache_path(file_path)
+            cache_path.write_text(json.dumps(docs, default=str), encoding='utf-8')
+        except Exception as e:
+            log.warning("⚠️  Could not write document cache for %s: %s", file_path, e)
+
+    def _load_doc_cache(self, file_path: Path) -> Optional[List[Dict[str, Any]]]:
+        """Return cached cleaned documents if newer than the YAML file"""
+        cache_path = self._cache_path(file_path)
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+                return json.loads(cache_path.read_text(encoding='utf-8'))
+        except Exception as e:
+            log.warning("⚠️  Ignoring unreadable document cache for %s: %s", file_path, e)
+        return None
+
+    def _cleanup_service(self, doc: Dict[str, Any]) -> None:
+        """Service-specific cleanup"""
+        spec = doc.get('spec', {})
+        # Remove auto-assigned cluster IPs
+        self._pop_tracked(spec, 'clusterIP')
+        self._pop_tracked(spec, 'clusterIPs')
+        # Remove health check node port for LoadBalancer
+        if spec.get('type') == 'LoadBalancer':
+            self._pop_tracked(spec, 'healthCheckNodePort')
+
+    def _cleanup_pvc(self, doc: Dict[str, Any]) -> None:
+        """PVC-specific cleanup"""
+        spec = doc.get('spec', {})
+        # Remove volume name (bound by controller)
+        self._pop_tracked(spec, 'volumeName')
+        # Remove volume mode if default
+        if spec.get('volumeMode') == 'Filesystem':
+            self._pop_tracked(spec, 'volumeMode')
+
+    def _cleanup_deployment(self, doc: Dict[str, Any]) -> None:
+        """Deployment-specific cleanup"""
+        spec = doc.get('spec', {})
+        # Remove observed generation
+        self._pop_tracked(spec, 'observedGeneration')
+        # Clean template metadata
+        if 'template' in spec and 'metadata' in spec['template']:
+            spec['template']['metadata'] = self._clean_metadata(
+                spec['template']['metadata']
+            )
+
+    def _cleanup_configmap_secret(self, doc: Dict[str, Any]) -> None:
+        """ConfigMap/Secret-specific cleanup"""
+        # Flag data keys that look like Kubernetes-generated
+        data = doc.get('data', {})
+        for key in data.keys() & self._GENERATED_DATA_KEYS:
+            log.info("🔍 Found potential generated data key: %s (keeping)", key)
     
     def clean_directory(self, directory: Path, pattern: str = "*.yaml", recursive: bool = True) -> None:
         """
         Clean all YAML files in a directory
-        
+
+        Files are independent of each other, so they are cleaned in
+        parallel across a process pool (one libyaml parser per worker).
+
         Args:
             directory: Directory to clean
             pattern: File pattern to match
             recursive: Clean subdirectories
         """
-        if recursive:
-            yaml_files = directory.rglob(pattern)
-        else:
-            yaml_files = directory.glob(pattern)
-        
-        success_count = 0
-        total_count = 0
-        
-        for yaml_file in yaml_files:
-            if yaml_file.is_file():
-                total_count += 1
-                if self.clean_yaml_file(yaml_file):
-                    success_count += 1
-        
-        print(f"🎯 Cleaned {success_count}/{total_count} YAML files in {directory}")
+        yaml_files = list(_walk_yaml_files(directory, pattern, recursive))
+
+        if not yaml_files:
+            log.info("🎯 Cleaned 0/0 YAML files in %s", directory)
+            return
+
+        with ProcessPoolExecutor(
+            initializer=_init_worker_cleaner,
+            initargs=(sorted(self.preserve_fields), self.cache_cleaned)
+        ) as executor:
+            results = list(executor.map(_clean_one, yaml_files, chunksize=8))
+
+        success_count = sum(results)
+        log.info("🎯 Cleaned %d/%d YAML files in %s", success_count, len(yaml_files), directory)
 
     def validate_cleanup(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -299,8 +475,12 @@ class KubernetesYAMLCleaner:
             Dict with validation results
         """
         try:
-            with open(file_path, 'r') as f:
-                docs = list(yaml.safe_load_all(f))
+            # Reuse the cleaned-document cache when it is fresh - validation
+            # is often re-run over unchanged files (e.g. in CI)
+            docs = self._load_doc_cache(file_path)
+            if docs is None:
+                with open(file_path, 'r') as f:
+                    docs = list(yaml.load_all(f, Loader=SafeLoader))
             
             issues = []
             for i, doc in enumerate(docs):
@@ -332,9 +512,24 @@ class KubernetesYAMLCleaner:
                 'document_count': 0
             }
 
+# Per-process cleaner used by the clean_directory worker pool; module scope
+# keeps the callables picklable for ProcessPoolExecutor
+_worker_cleaner: Optional[KubernetesYAMLCleaner] = None
+
+def _init_worker_cleaner(preserve_fields: List[str], cache_cleaned: bool = False) -> None:
+    """Build one KubernetesYAMLCleaner per pool worker"""
+    global _worker_cleaner
+    _worker_cleaner = KubernetesYAMLCleaner(preserve_fields=preserve_fields,
+                                            cache_cleaned=cache_cleaned)
+
+def _clean_one(file_path: Path) -> bool:
+    """Clean a single file inside a pool worker"""
+    return _worker_cleaner.clean_yaml_file(file_path)
+
 def main():
     """Example usage of the YAML cleaner"""
-    
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     # Initialize cleaner
     cleaner = KubernetesYAMLCleaner()
     
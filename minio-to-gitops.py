@@ -9,6 +9,8 @@ with namespace-based organization, ArgoCD Applications, and Kustomizations.
 import os
 import sys
 import json
+import functools
+import logging
 import yaml
 import time
 import stat
@@ -18,6 +20,8 @@ import subprocess
 import re
 import shutil
 import random
+import concurrent.futures
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Tuple
 from dataclasses import dataclass, field
@@ -25,6 +29,19 @@ from minio import Minio
 from minio.error import S3Error
 import urllib3
 
+# Per-file progress goes through the logger with lazy %s formatting: when the
+# level is gated off, neither the message string nor the stdout flush happens,
+# which matters in the per-object download/scan loops. Stage-level status and
+# summaries stay on print.
+log = logging.getLogger(__name__)
+
+# Prefer the libyaml C bindings when PyYAML is built with them — several times
+# faster than the pure-Python loader/emitter on manifest-sized documents.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 # Custom Exceptions for better error handling
 class MinioGitOpsError(Exception):
     """Base exception for Minio GitOps generator errors"""
@@ -107,16 +124,17 @@ class Constants:
     PROGRESS_DECIMAL_PLACES = 1
     
     # Memory Management
-    MEMORY_BATCH_SIZE = 100  # Process objects in batches to control memory usage
+    MEMORY_BATCH_SIZE = 100  # Objects per batch; amortizes batch_lock acquisition across scan threads
     
     # Default Environment Configuration
     DEFAULT_ENVIRONMENTS = ['dev', 'test', 'preprod', 'prod']
     
     # Directory Structure
     BASE_NAMESPACE_DIR = 'namespaces'
-    ENVIRONMENTS_DIR = 'environments' 
+    ENVIRONMENTS_DIR = 'environments'
     ARGOCD_APPS_DIR = 'argocd-apps'
     DEFAULT_BASE_ENV = 'dev'
+    SCAN_STATE_FILE = '.minio-gitops-state.json'  # object -> etag map from the last run
     
     # Input Validation and Security Limits
     MAX_FILE_SIZE_MB = 50  # Maximum YAML file size in MB
@@ -155,6 +173,8 @@ class Constants:
     # Minio Connection Pool Settings
     MAX_POOL_CONNECTIONS = 10  # Maximum connections in pool
     MAX_POOL_SIZE = 20         # Maximum pool size
+    MAX_DOWNLOAD_WORKERS = 32  # Concurrent object downloads
+    MAX_SCAN_WORKERS = 16      # Concurrent per-prefix bucket listings
     
     # Git Platform Detection Patterns (configurable)
     PLATFORM_PATTERNS = {
@@ -188,6 +208,133 @@ class Constants:
     # Default batch processing size
     MEMORY_BATCH_SIZE = 100
 
+# Kubernetes naming convention: lowercase alphanumerics and hyphens.
+# Compiled once at module level; the validators run per object/namespace.
+_K8S_NAME_RE = re.compile(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?\Z')
+
+# Filename-based categorization patterns, compiled once at import. Order
+# matters: earlier categories win when a filename matches several keyword
+# sets, so this must stay a sequence rather than an unordered mapping.
+_FILENAME_CATEGORY_PATTERNS = tuple(
+    (category, re.compile('|'.join(map(re.escape, keywords))))
+    for category, keywords in (
+        ('deployments', ['deploy', 'deployment']),
+        ('services', ['service', 'svc']),
+        ('configmaps', ['config', 'cm', 'configmap']),
+        ('secrets', ['secret']),
+        ('persistentvolumeclaims', ['pvc', 'persistent', 'volume', 'claim']),
+        ('routes', ['route']),
+        ('ingress', ['ingress']),
+        ('cronjobs', ['cron', 'cronjob']),
+        ('jobs', ['job']),
+        ('hpa', ['hpa', 'autoscal', 'horizontal']),
+        ('imagestreams', ['image', 'stream', 'imagestream']),
+        ('networkpolicies', ['network', 'policy', 'netpol']),
+        ('statefulsets', ['stateful', 'sts']),
+        ('daemonsets', ['daemon', 'ds']),
+        ('replicasets', ['replica', 'rs']),
+        ('pods', ['pod']),
+        ('namespaces', ['namespace', 'ns']),
+        ('roles', ['role']),
+        ('rolebindings', ['rolebind', 'binding']),
+        ('serviceaccounts', ['serviceaccount', 'sa']),
+    )
+)
+
+# Lowercased Kubernetes kind -> resource directory name
+_KIND_MAPPING = {
+    'deployment': 'deployments',
+    'service': 'services',
+    'configmap': 'configmaps',
+    'secret': 'secrets',
+    'persistentvolumeclaim': 'persistentvolumeclaims',
+    'route': 'routes',
+    'ingress': 'ingress',
+    'cronjob': 'cronjobs',
+    'job': 'jobs',
+    'horizontalpodautoscaler': 'hpa',
+    'imagestream': 'imagestreams',
+    'networkpolicy': 'networkpolicies',
+    'statefulset': 'statefulsets',
+    'daemonset': 'daemonsets',
+    'replicaset': 'replicasets',
+    'pod': 'pods',
+    'namespace': 'namespaces',
+    'role': 'roles',
+    'rolebinding': 'rolebindings',
+    'clusterrole': 'clusterroles',
+    'clusterrolebinding': 'clusterrolebindings',
+    'serviceaccount': 'serviceaccounts'
+}
+
+# Keys the built-in cleanup strips. If none of them occur in the raw text the
+# file is already clean, and the substring scan (C-level, ~GB/s) lets us skip
+# the YAML parse/re-emit round-trip (~MB/s) entirely.
+_CLEANUP_TARGET_KEYS = (
+    'uid:', 'resourceVersion:', 'generation:', 'creationTimestamp:',
+    'managedFields:', 'selfLink:', 'finalizers:', 'ownerReferences:',
+    'status:', 'clusterIP', 'volumeName:'
+)
+
+# metadata keys the built-in cleanup removes from every document
+_METADATA_STRIP = frozenset({
+    'uid', 'resourceVersion', 'generation', 'creationTimestamp',
+    'managedFields', 'selfLink', 'finalizers', 'ownerReferences'
+})
+
+# JSON6902 patch bodies for the environment overlays. Kustomize requires the
+# patch field to be a YAML string (not structured data), so these stay string
+# templates; hoisting them avoids rebuilding the literals per environment/PVC.
+_REPLICA_PATCH_TEMPLATE = '''- op: replace
+  path: /spec/replicas
+  value: {replicas}
+- op: add
+  path: /spec/template/spec/containers/0/env/-
+  value:
+    name: ENVIRONMENT
+    value: "{env}"'''
+
+_STORAGE_PATCH_TEMPLATE = '''- op: replace
+  path: /spec/resources/requests/storage
+  value: "{size}"'''
+
+# The ArgoCD Application manifest has a fully fixed schema — only a handful of
+# scalar values vary — so it is emitted from this template instead of paying
+# the generic YAML emitter per environment. Kustomizations keep yaml.dump
+# because their resources/patches sections are data-driven.
+_ARGOCD_APP_TEMPLATE = """\
+apiVersion: argoproj.io/v1alpha1
+kind: Application
+metadata:
+  name: {name}
+  namespace: argocd
+  labels:
+    namespace: {namespace}
+    environment: {env}
+spec:
+  project: default
+  source:
+    repoURL: {repo_url}
+    targetRevision: main
+    path: namespaces/{namespace}/environments/{env}
+  destination:
+    server: {cluster}
+    namespace: {target_namespace}
+  syncPolicy:
+    automated:
+      prune: {automated}
+      selfHeal: {automated}
+    syncOptions:
+    - CreateNamespace=true
+  info:
+  - name: Environment
+    value: {env_title}
+  - name: Target Cluster
+    value: {cluster}
+  - name: Namespace
+    value: {target_namespace}
+"""
+
 def retry_with_exponential_backoff(max_attempts=None, initial_delay=None, max_delay=None, backoff_factor=None):
     """Decorator for retrying functions with exponential backoff"""
     if max_attempts is None:
@@ -498,14 +645,17 @@ def timeout_handler(timeout_seconds=None):
         return wrapper
     return decorator
 
-@dataclass
+# slots=True drops the per-instance __dict__ (these are created once per
+# namespace and their attributes are read repeatedly in the generator loops);
+# frozen=True documents that they are plain value objects after scan time.
+@dataclass(slots=True, frozen=True)
 class ClusterMapping:
     dev: str
     test: str
     preprod: str
     prod: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NamespaceConfig:
     name: str
     resources: Dict[str, List[str]]  # resource_type -> [file_names]
@@ -541,16 +691,18 @@ class ErrorHandler:
         print(f"File error in {context}{file_info}: {error}")
 
 
-@dataclass 
+@dataclass(slots=True)
 class ProcessingResult:
     """Track processing results and errors"""
-    success_files: List[str] = field(default_factory=list)
+    # Successes are only ever counted, so a counter replaces the filename
+    # list that used to hold one string reference per processed object.
+    success_count: int = 0
     failed_files: List[Tuple[str, str]] = field(default_factory=list)  # (filename, error)
     warnings: List[str] = field(default_factory=list)
     namespaces_found: List[str] = field(default_factory=list)
-    
-    def add_success(self, filename: str):
-        self.success_files.append(filename)
+
+    def add_success(self, filename: str = None):
+        self.success_count += 1
     
     def add_failure(self, filename: str, error: str):
         self.failed_files.append((filename, error))
@@ -562,25 +714,31 @@ class ProcessingResult:
         return len(self.failed_files) > 0
     
     def print_summary(self):
-        print(f"\nProcessing Summary:")
-        print(f"   Success: {len(self.success_files)} files")
-        print(f"   Failed: {len(self.failed_files)} files")
-        print(f"   Warnings: {len(self.warnings)}")
-        print(f"   Namespaces: {len(self.namespaces_found)}")
-        
+        # Assemble the whole report first and emit it as one write, instead
+        # of a dozen separate print calls each flushing stdout.
+        lines = [
+            "\nProcessing Summary:",
+            f"   Success: {self.success_count} files",
+            f"   Failed: {len(self.failed_files)} files",
+            f"   Warnings: {len(self.warnings)}",
+            f"   Namespaces: {len(self.namespaces_found)}",
+        ]
+
         if self.failed_files:
-            print(f"\nFailed Files:")
+            lines.append("\nFailed Files:")
             for filename, error in self.failed_files[:Constants.MAX_FAILED_FILES_DISPLAY]:
-                print(f"   • {filename}: {error}")
+                lines.append(f"   • {filename}: {error}")
             if len(self.failed_files) > Constants.MAX_FAILED_FILES_DISPLAY:
-                print(f"   • ... and {len(self.failed_files) - Constants.MAX_FAILED_FILES_DISPLAY} more")
-        
+                lines.append(f"   • ... and {len(self.failed_files) - Constants.MAX_FAILED_FILES_DISPLAY} more")
+
         if self.warnings:
-            print(f"\nWarnings:")
+            lines.append("\nWarnings:")
             for warning in self.warnings[:Constants.MAX_WARNINGS_DISPLAY]:
-                print(f"   • {warning}")
+                lines.append(f"   • {warning}")
             if len(self.warnings) > Constants.MAX_WARNINGS_DISPLAY:
-                print(f"   • ... and {len(self.warnings) - Constants.MAX_WARNINGS_DISPLAY} more")
+                lines.append(f"   • ... and {len(self.warnings) - Constants.MAX_WARNINGS_DISPLAY} more")
+
+        print("\n".join(lines))
 
 class MinioHandler:
     """Handles all Minio connection and object processing operations"""
@@ -592,7 +750,10 @@ class MinioHandler:
                 connect=Constants.CONNECTION_TIMEOUT,
                 read=Constants.READ_TIMEOUT
             ),
-            maxsize=Constants.MAX_POOL_CONNECTIONS,
+            # Size the pool to the download concurrency so every worker keeps
+            # a persistent connection; a smaller pool makes concurrent GETs
+            # pay repeated TCP/TLS setup instead of amortizing it.
+            maxsize=max(Constants.MAX_POOL_CONNECTIONS, Constants.MAX_DOWNLOAD_WORKERS),
             block=False,
             retries=urllib3.Retry(
                 total=Constants.MAX_RETRY_ATTEMPTS,
@@ -633,9 +794,11 @@ class MinioHandler:
         
         try:
             objects = self.minio_client.list_objects(
-                bucket_name, 
+                bucket_name,
                 prefix=prefix,
-                recursive=recursive
+                recursive=recursive,
+                use_api_v1=False,  # ListObjectsV2 pagination
+                fetch_owner=False
             )
             return objects
         except Exception as e:
@@ -738,7 +901,7 @@ class ValidationManager:
             raise ValidationError(f"{resource_type.capitalize()} name too long: {name}")
         
         # Kubernetes naming convention: lowercase letters, numbers, hyphens
-        if not re.match(r'^[a-z0-9]([a-z0-9\-]*[a-z0-9])?$', name):
+        if not _K8S_NAME_RE.match(name):
             raise ValidationError(f"Invalid {resource_type} name format: {name}")
     
     @staticmethod
@@ -767,25 +930,28 @@ class FileManager:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Check available disk space (basic check)
+            data = content.encode('utf-8')
             free_space = shutil.disk_usage(file_path.parent).free
-            content_size = len(content.encode('utf-8'))
-            
+            content_size = len(data)
+
             # Require at least 100MB free space or 10x content size, whichever is larger
             min_free_space = max(100 * 1024 * 1024, content_size * 10)
             if free_space < min_free_space:
                 raise OSError(f"Insufficient disk space for {description}: {free_space / (1024*1024):.1f}MB free")
-            
-            # Write content with atomic operation (write to temp then rename)
+
+            # Write content with atomic operation (write to temp then rename).
+            # Binary mode reuses the bytes already encoded for the size check
+            # instead of paying a second encode through a TextIOWrapper.
             temp_path = file_path.with_suffix('.tmp')
             try:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
                     f.flush()  # Ensure content is written
                     os.fsync(f.fileno())  # Force OS to write to disk
                 
                 # Atomic rename
                 temp_path.replace(file_path)
-                print(f"Generated {description}: {file_path}")
+                log.debug("Generated %s: %s", description, file_path)
                 
             except Exception as e:
                 # Clean up temp file if something went wrong
@@ -871,6 +1037,18 @@ class MinioGitOpsGenerator:
         
         # Resource management
         self._askpass_script_path = None
+
+        # Object etags collected during the scan; compared against the
+        # persisted state of the previous run to skip unchanged downloads
+        self._object_etags: Dict[str, str] = {}
+
+        # Resolve the advanced cleaner once; _cleanup_k8s_metadata runs per
+        # downloaded file and re-importing/constructing it there wastes work.
+        try:
+            from advanced_yaml_cleanup import KubernetesYAMLCleaner
+            self._advanced_cleaner = KubernetesYAMLCleaner()
+        except ImportError:
+            self._advanced_cleaner = None
         
         # Validate environments exist in cluster mappings
         self._validate_environment_configuration()
@@ -934,26 +1112,28 @@ class MinioGitOpsGenerator:
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
             # Check available disk space (basic check)
-    
+            data = content.encode('utf-8')
             free_space = shutil.disk_usage(file_path.parent).free
-            content_size = len(content.encode('utf-8'))
-            
+            content_size = len(data)
+
             # Require at least 100MB free space or 10x content size, whichever is larger
             min_free_space = max(100 * 1024 * 1024, content_size * 10)
             if free_space < min_free_space:
                 raise OSError(f"Insufficient disk space for {description}: {free_space / (1024*1024):.1f}MB free")
-            
-            # Write content with atomic operation (write to temp then rename)
+
+            # Write content with atomic operation (write to temp then rename).
+            # Binary mode reuses the bytes already encoded for the size check
+            # instead of paying a second encode through a TextIOWrapper.
             temp_path = file_path.with_suffix('.tmp')
             try:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                with open(temp_path, 'wb') as f:
+                    f.write(data)
                     f.flush()  # Ensure content is written
                     os.fsync(f.fileno())  # Force OS to write to disk
                 
                 # Atomic rename
                 temp_path.replace(file_path)
-                print(f"Generated {description}: {file_path}")
+                log.debug("Generated %s: %s", description, file_path)
                 
             except Exception as e:
                 # Clean up temp file if something went wrong
@@ -1081,7 +1261,7 @@ class MinioGitOpsGenerator:
         
         # Basic Kubernetes naming validation
 
-        if not re.match(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$', name):
+        if not _K8S_NAME_RE.match(name):
             raise ValidationError(f"Invalid {resource_type} name format: {name}. Must be lowercase alphanumeric with hyphens.")
     
     def _validate_namespace_limits(self, namespaces: dict):
@@ -1098,39 +1278,62 @@ class MinioGitOpsGenerator:
         """Scan Minio bucket and detect namespaces with their resources"""
         print(f"Scanning Minio bucket: {self.minio_handler.bucket_name}/{self.minio_handler.bucket_prefix}")
         
-        namespace_resources = {}
+        # defaultdict folds the per-object "initialize namespace / initialize
+        # resource type" checks into C-level __missing__ handling
+        namespace_resources = defaultdict(lambda: defaultdict(list))
         result = ProcessingResult()
         
         try:
-            # Memory-optimized batch processing approach
-            print("Processing objects in memory-efficient batches...")
-            
+            # Batched processing: the listing itself is a lazy generator, the
+            # batch buffer exists so scan threads take batch_lock once per
+            # MEMORY_BATCH_SIZE objects instead of once per object.
+            print("Processing objects in batches...")
+
             batch_size = Constants.MEMORY_BATCH_SIZE
-            batch = []
             processed_count = 0
             total_objects = 0  # We'll count as we go
-            
-            # Process objects in batches to control memory usage with resilient connection
-            for obj in self.minio_handler.list_objects(
-                recursive=True
-            ):
-                total_objects += 1
-                batch.append(obj)
-                
-                # Process batch when it's full
-                if len(batch) >= batch_size:
-                    processed_count += self._process_object_batch(batch, namespace_resources, result, processed_count, total_objects)
+            batch_lock = threading.Lock()
+
+            def scan_prefix(prefix: str):
+                """Stream one recursive listing, batching into the shared dicts"""
+                nonlocal processed_count, total_objects
+                batch = []
+
+                def flush():
+                    nonlocal processed_count, total_objects
+                    with batch_lock:
+                        total_objects += len(batch)
+                        processed_count += self._process_object_batch(
+                            batch, namespace_resources, result, processed_count, total_objects)
                     batch.clear()  # Clear batch to free memory
-                    
-                    # Force garbage collection for large batches
-                    if processed_count % (batch_size * 10) == 0:
-                        import gc
-                        gc.collect()
-            
-            # Process final batch
-            if batch:
-                processed_count += self._process_object_batch(batch, namespace_resources, result, processed_count, total_objects)
-                
+
+                for obj in self.minio_handler.list_objects(prefix=prefix, recursive=True):
+                    batch.append(obj)
+                    # Process batch when it's full
+                    if len(batch) >= batch_size:
+                        flush()
+
+                # Process final batch
+                if batch:
+                    flush()
+
+            # Enumerate top-level "namespace directories" first; each gets its
+            # own recursive listing so large buckets scan in parallel instead
+            # of through one long serial listObjects stream.
+            namespace_prefixes = [
+                obj.object_name for obj in self.minio_handler.list_objects(recursive=False)
+                if obj.object_name.endswith('/')
+            ]
+
+            if namespace_prefixes:
+                max_workers = min(Constants.MAX_SCAN_WORKERS, len(namespace_prefixes))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    # Surface worker exceptions by consuming the results
+                    list(executor.map(scan_prefix, namespace_prefixes))
+            else:
+                # Flat bucket (no directory-style prefixes): single recursive scan
+                scan_prefix(self.minio_handler.bucket_prefix)
+
             print(f"Total processed: {processed_count}/{total_objects} objects")
         
         except S3Error as e:
@@ -1170,18 +1373,19 @@ class MinioGitOpsGenerator:
             return [], result
         
         # Convert to NamespaceConfig objects
+        default_mapping = self.cluster_mappings['default']
         for ns_name, resources in namespace_resources.items():
-            # Use default cluster mapping or namespace-specific if provided
-            cluster_mapping = ClusterMapping(
-                dev=self.cluster_mappings.get(ns_name, {}).get('dev', self.cluster_mappings['default']['dev']),
-                test=self.cluster_mappings.get(ns_name, {}).get('test', self.cluster_mappings['default']['test']),
-                preprod=self.cluster_mappings.get(ns_name, {}).get('preprod', self.cluster_mappings['default']['preprod']),
-                prod=self.cluster_mappings.get(ns_name, {}).get('prod', self.cluster_mappings['default']['prod'])
-            )
-            
+            # Use default cluster mapping or namespace-specific if provided;
+            # fetch the override dict once instead of per environment.
+            ns_overrides = self.cluster_mappings.get(ns_name, {})
+            cluster_mapping = ClusterMapping(**{
+                env: ns_overrides.get(env, default_mapping[env])
+                for env in ('dev', 'test', 'preprod', 'prod')
+            })
+
             self.namespaces.append(NamespaceConfig(
                 name=ns_name,
-                resources=resources,
+                resources=dict(resources),
                 cluster_mapping=cluster_mapping
             ))
         
@@ -1204,7 +1408,7 @@ class MinioGitOpsGenerator:
                     self._validate_file_size(obj.size, obj.object_name)
                 
                 # Parse path with validation
-                path_result = self._safe_parse_path(obj.object_name, self.bucket_prefix)
+                path_result = self._safe_parse_path(obj.object_name, self.minio_handler.bucket_prefix)
                 if not path_result:
                     result.add_warning(f"Skipping file with invalid path structure: {obj.object_name}")
                     continue
@@ -1214,26 +1418,27 @@ class MinioGitOpsGenerator:
                 # Validate namespace name
                 self._validate_kubernetes_name(namespace, "namespace")
                 
-                # Initialize namespace if not exists
+                # Remember the etag for incremental-download bookkeeping
+                etag = getattr(obj, 'etag', None)
+                if etag:
+                    self._object_etags[obj.object_name] = etag
+
+                # Track first sighting of each namespace
                 if namespace not in namespace_resources:
-                    namespace_resources[namespace] = {}
                     result.namespaces_found.append(namespace)
-                
+
                 # Categorize resource by filename pattern
                 resource_type = self._categorize_resource(filename)
-                if resource_type not in namespace_resources[namespace]:
-                    namespace_resources[namespace][resource_type] = []
-                
                 namespace_resources[namespace][resource_type].append(filename)
                 result.add_success(obj.object_name)
                 
                 # Progress indicator
                 if current_count % Constants.PROGRESS_UPDATE_INTERVAL == 0 or current_count == total_objects:
                     progress = (current_count / total_objects) * 100
-                    print(f"Progress: {current_count}/{total_objects} ({progress:.{Constants.PROGRESS_DECIMAL_PLACES}f}%) - Found: {namespace}/{resource_type}/{filename}")
-                elif current_count % 20 == 0:  # Show less frequent updates to reduce noise
-                    print(f"Found: {namespace}/{resource_type}/{filename}")
-                
+                    log.info("Progress: %d/%d (%.*f%%) - Found: %s/%s/%s",
+                             current_count, total_objects, Constants.PROGRESS_DECIMAL_PLACES,
+                             progress, namespace, resource_type, filename)
+
                 batch_processed += 1
                 
             except Exception as e:
@@ -1243,23 +1448,31 @@ class MinioGitOpsGenerator:
         
         return batch_processed
     
-    def _validate_yaml_content_file(self, file_path: Path) -> bool:
-        """Validate that YAML file has proper structure and no leftover K8s metadata"""
+    def _validate_yaml_content_file(self, file_path) -> bool:
+        """Validate that YAML content has proper structure and no leftover K8s metadata
+
+        Accepts either a Path or an already-open text stream (e.g. io.StringIO),
+        so in-memory content can be validated without a disk round-trip.
+        """
         try:
-            # Check file exists and is readable
-            if not file_path.exists():
-                raise FileNotFoundError(f"YAML file does not exist: {file_path}")
-            
-            if not file_path.is_file():
-                raise ValueError(f"Path is not a file: {file_path}")
-            
-            # Check file size before opening
-            file_size = file_path.stat().st_size
-            self._validate_file_size(file_size, str(file_path))
-            
-            with open(file_path, 'r', encoding='utf-8') as f:
-                docs = list(yaml.safe_load_all(f))
-                
+            # In-memory streams skip the filesystem checks entirely
+            if hasattr(file_path, 'read'):
+                docs = list(yaml.load_all(file_path, Loader=_YamlLoader))
+            else:
+                # Check file exists and is readable
+                if not file_path.exists():
+                    raise FileNotFoundError(f"YAML file does not exist: {file_path}")
+
+                if not file_path.is_file():
+                    raise ValueError(f"Path is not a file: {file_path}")
+
+                # Check file size before opening
+                file_size = file_path.stat().st_size
+                self._validate_file_size(file_size, str(file_path))
+
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    docs = list(yaml.load_all(f, Loader=_YamlLoader))
+
         except FileNotFoundError as e:
             print(f"File not found: {e}")
             return False
@@ -1280,27 +1493,29 @@ class MinioGitOpsGenerator:
             return False
         
         try:
-            
+            # Streams may not carry a name attribute (e.g. io.StringIO)
+            source_name = getattr(file_path, 'name', str(file_path))
+
             for i, doc in enumerate(docs):
                 if not doc:
                     continue
-                    
+
                 # Check for basic K8s structure
                 if not isinstance(doc, dict):
-                    print(f"Document {i} in {file_path.name} is not a dictionary")
+                    print(f"Document {i} in {source_name} is not a dictionary")
                     return False
-                
+
                 # Warn about remaining problematic metadata
                 if 'metadata' in doc:
                     problematic_fields = ['uid', 'resourceVersion', 'managedFields']
                     found_issues = [f for f in problematic_fields if f in doc['metadata']]
                     if found_issues:
-                        print(f"Document {i} in {file_path.name} still contains: {found_issues}")
+                        print(f"Document {i} in {source_name} still contains: {found_issues}")
                         return False
-                
+
                 # Check for status section
                 if 'status' in doc:
-                    print(f"Document {i} in {file_path.name} still contains status section")
+                    print(f"Document {i} in {source_name} still contains status section")
                     return False
                     
             return True
@@ -1312,66 +1527,82 @@ class MinioGitOpsGenerator:
             print(f"Validation error for {file_path}: {e}")
             raise YAMLProcessingError(f"Validation error for {file_path}: {e}") from e
     
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _parse_path_impl(object_path: str, prefix: str) -> Tuple[str, str]:
+        """Pure path-parsing core, cached because object paths repeat
+
+        Depends only on its string arguments, so identical paths (re-scans,
+        retries, duplicated prefixes) resolve from the cache.
+        """
+        # Remove prefix and clean path - always use forward slashes for Minio.
+        # removeprefix only strips a leading match, unlike str.replace which
+        # would also delete the prefix string occurring mid-path.
+        clean_path = object_path.removeprefix(prefix).strip('/')
+
+        # Normalize path separators - Minio uses POSIX style regardless of platform
+        clean_path = clean_path.replace('\\', '/')
+
+        # Plain string split instead of PurePosixPath: no path object or
+        # .parts tuple allocation per call; empty segments from doubled
+        # slashes are dropped the same way .parts would drop them.
+        path_parts = [part for part in clean_path.split('/') if part]
+
+        # Enhanced path structure validation
+        if len(path_parts) < Constants.MIN_PATH_PARTS:
+            raise PathValidationError(f"Path too short: {object_path} (need at least {Constants.MIN_PATH_PARTS} parts)")
+
+        # Extract namespace and filename (bounds guaranteed by check above)
+        namespace = path_parts[-2]  # Second to last part
+        filename = path_parts[-1]   # Last part
+
+        return namespace, filename
+
     def _safe_parse_path(self, object_path: str, prefix: str) -> Tuple[str, str] or None:
         """Platform-agnostic path parsing for Minio object paths"""
         try:
-            # Import platform-specific utilities
-    
-            from pathlib import PurePosixPath  # Minio always uses POSIX paths
-            
-            # Remove prefix and clean path - always use forward slashes for Minio
-            clean_path = object_path.replace(prefix, '').strip('/')
-            
-            # Normalize path separators - Minio uses POSIX style regardless of platform
-            clean_path = clean_path.replace('\\', '/')
-            
-            # Use PurePosixPath for consistent parsing across platforms
-            path_obj = PurePosixPath(clean_path)
-            path_parts = path_obj.parts
-            
-            # Enhanced path structure validation
-            if len(path_parts) < Constants.MIN_PATH_PARTS:
-                raise PathValidationError(f"Path too short: {object_path} (need at least {Constants.MIN_PATH_PARTS} parts)")
-            
-            # Safe array access with bounds checking
-            try:
-                # Extract namespace and filename with bounds protection
-                if len(path_parts) >= 2:
-                    namespace = path_parts[-2]  # Second to last part
-                    filename = path_parts[-1]   # Last part
-                else:
-                    raise PathValidationError(f"Insufficient path components: {path_parts}")
-            except IndexError as e:
-                raise PathValidationError(f"Path parsing error for {object_path}: {e}") from e
-            
+            namespace, filename = self._parse_path_impl(object_path, prefix)
+
             # Basic validation
             if not namespace or not filename:
                 return None
-                
+
             # Sanitize namespace name (Kubernetes naming rules)
             if not self._is_valid_namespace_name(namespace):
                 raise NamespaceValidationError(f"Invalid namespace name: {namespace}")
-                
+
             return namespace, filename
-            
+
         except Exception as e:
             print(f"Path parsing error for {object_path}: {e}")
             return None
     
-    def _is_valid_namespace_name(self, name: str) -> bool:
-        """Validate Kubernetes namespace naming rules"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_valid_namespace_name(name: str) -> bool:
+        """Validate Kubernetes namespace naming rules
 
-        
+        Cached: the same namespace name recurs once per object it contains.
+        """
         # Basic Kubernetes naming rules
         if len(name) > Constants.MAX_NAMESPACE_LENGTH:
             return False
-        if not re.match(r'^[a-z0-9]([-a-z0-9]*[a-z0-9])?$', name):
+        if not _K8S_NAME_RE.match(name):
             return False
         return True
     
-    def _categorize_resource(self, filename: str, file_content: str = None) -> str:
-        """Enhanced resource categorization using both filename and YAML content"""
-        
+    def _categorize_resource(self, filename: str, file_content: str = None,
+                             parsed_kind: str = None) -> str:
+        """Enhanced resource categorization using both filename and YAML content
+
+        Callers that already parsed the content (e.g. the cleanup pass) can
+        pass the extracted kind to skip a second YAML parse.
+        """
+        if parsed_kind:
+            category = _KIND_MAPPING.get(parsed_kind.lower())
+            if category:
+                return category
+
         # First try YAML content analysis if available
         if file_content:
             try:
@@ -1389,8 +1620,8 @@ class MinioGitOpsGenerator:
         try:
             # Validate YAML content first
             self._validate_yaml_content(content, filename)
-            
-            docs = list(yaml.safe_load_all(content))
+
+            docs = list(yaml.load_all(content, Loader=_YamlLoader))
             for doc in docs:
                 if not doc or 'kind' not in doc:
                     continue
@@ -1399,73 +1630,33 @@ class MinioGitOpsGenerator:
                 self._validate_yaml_structure(doc, filename)
                     
                 kind = doc['kind'].lower()
-                
+
                 # Direct kind mapping
-                kind_mapping = {
-                    'deployment': 'deployments',
-                    'service': 'services', 
-                    'configmap': 'configmaps',
-                    'secret': 'secrets',
-                    'persistentvolumeclaim': 'persistentvolumeclaims',
-                    'route': 'routes',
-                    'ingress': 'ingress',
-                    'cronjob': 'cronjobs',
-                    'job': 'jobs',
-                    'horizontalpodautoscaler': 'hpa',
-                    'imagestream': 'imagestreams',
-                    'networkpolicy': 'networkpolicies',
-                    'statefulset': 'statefulsets',
-                    'daemonset': 'daemonsets',
-                    'replicaset': 'replicasets',
-                    'pod': 'pods',
-                    'namespace': 'namespaces',
-                    'role': 'roles',
-                    'rolebinding': 'rolebindings',
-                    'clusterrole': 'clusterroles',
-                    'clusterrolebinding': 'clusterrolebindings',
-                    'serviceaccount': 'serviceaccounts'
-                }
-                
-                if kind in kind_mapping:
-                    return kind_mapping[kind]
+                if kind in _KIND_MAPPING:
+                    return _KIND_MAPPING[kind]
                     
             return 'other'
             
         except yaml.YAMLError:
             return 'other'
     
-    def _categorize_by_filename(self, filename: str) -> str:
-        """Enhanced filename-based categorization with more patterns"""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _categorize_by_filename(filename: str) -> str:
+        """Enhanced filename-based categorization with more patterns
+
+        Cached: GitOps trees repeat the same basenames (deployment.yaml,
+        service.yaml, ...) across namespaces, so repeats skip the pattern
+        scan — and the unrecognized-file warning prints once per name.
+        """
         filename_lower = filename.lower()
-        
-        # More comprehensive filename patterns
-        patterns = {
-            'deployments': ['deploy', 'deployment'],
-            'services': ['service', 'svc'],
-            'configmaps': ['config', 'cm', 'configmap'],
-            'secrets': ['secret'],
-            'persistentvolumeclaims': ['pvc', 'persistent', 'volume', 'claim'],
-            'routes': ['route'],
-            'ingress': ['ingress'],
-            'cronjobs': ['cron', 'cronjob'],
-            'jobs': ['job'],
-            'hpa': ['hpa', 'autoscal', 'horizontal'],
-            'imagestreams': ['image', 'stream', 'imagestream'],
-            'networkpolicies': ['network', 'policy', 'netpol'],
-            'statefulsets': ['stateful', 'sts'],
-            'daemonsets': ['daemon', 'ds'],
-            'replicasets': ['replica', 'rs'],
-            'pods': ['pod'],
-            'namespaces': ['namespace', 'ns'],
-            'roles': ['role'],
-            'rolebindings': ['rolebind', 'binding'],
-            'serviceaccounts': ['serviceaccount', 'sa']
-        }
-        
-        for category, keywords in patterns.items():
-            if any(keyword in filename_lower for keyword in keywords):
+
+        # One pre-compiled alternation per category replaces the per-call
+        # keyword lists and Python-level substring scans.
+        for category, pattern in _FILENAME_CATEGORY_PATTERNS:
+            if pattern.search(filename_lower):
                 return category
-                
+
         # Still return 'other' but log for investigation
         print(f"Unrecognized resource type for file: {filename}")
         return 'other'
@@ -1474,68 +1665,247 @@ class MinioGitOpsGenerator:
         """Download all resources from Minio to local filesystem with error handling"""
         print("📥 Downloading resources from Minio...")
         result = ProcessingResult()
-        
+
+        # Create the whole directory tree up front so the download loop stays
+        # branch-free on path setup.
+        try:
+            self._precreate_directories()
+        except Exception as e:
+            result.add_failure("create_directories", str(e))
+            print(f"Failed to create directory structure: {e}")
+            return result
+
+        # Collect all (minio_path, local_path) pairs first so downloads can be
+        # dispatched concurrently — each fget_object blocks on an HTTP round-trip,
+        # so the overall stage is network-latency-bound, not CPU-bound.
+        # Objects whose etag matches the persisted state of the previous run
+        # are already clean on disk and skipped outright, making steady-state
+        # runs O(changed files) instead of O(all files).
+        previous_etags = self._load_scan_state()
+        current_etags = {}
+        skipped_count = 0
+        download_tasks = []
         for namespace in self.namespaces:
             base_path = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name / Constants.ENVIRONMENTS_DIR / self.base_env
-            
+
             for resource_type, filenames in namespace.resources.items():
                 resource_dir = base_path / resource_type
-                
-                try:
-                    resource_dir.mkdir(parents=True, exist_ok=True)
-                except Exception as e:
-                    result.add_failure(f"create_directory_{resource_dir}", str(e))
-                    print(f"Failed to create directory {resource_dir}: {e}")
-                    continue
-                
+
                 for filename in filenames:
                     minio_path = f"{self.minio_handler.bucket_prefix}/{namespace.name}/{filename}".strip('/')
                     local_path = resource_dir / filename
-                    
-                    try:
-                        # Download file from Minio
-                        self.minio_handler.minio_client.fget_object(
-                            self.minio_handler.bucket_name,
-                            minio_path,
-                            str(local_path)
-                        )
-                        
-                        # Enhanced categorization using downloaded content
-                        try:
-                            with open(local_path, 'r') as f:
-                                file_content = f.read()
-                            
-                            # Re-categorize with content analysis
-                            better_category = self._categorize_resource(local_path.name, file_content)
-                            if better_category != resource_type:
-                                print(f"Improved categorization: {local_path.name} {resource_type} → {better_category}")
-                                # Update category if needed (would require refactoring, for now just log)
-                                
-                        except Exception as e:
-                            print(f"Could not re-categorize {local_path.name}: {e}")
-                        
-                        # Clean up Kubernetes metadata
-                        cleanup_success = self._cleanup_k8s_metadata(local_path)
-                        if not cleanup_success:
-                            result.add_warning(f"Cleanup failed for {local_path}, but file downloaded")
-                        else:
-                            # Validate cleanup was successful
-                            if not self._validate_yaml_content(local_path):
-                                result.add_warning(f"YAML validation failed for {local_path} after cleanup")
-                        
-                        result.add_success(str(local_path))
-                        print(f"Downloaded: {minio_path} → {local_path}")
-                        
-                    except S3Error as e:
-                        result.add_failure(minio_path, f"Minio error: {e}")
-                        print(f"Failed to download {minio_path}: {e}")
-                        continue
-                    except Exception as e:
-                        result.add_failure(minio_path, f"Unexpected error: {e}")
-                        print(f"Unexpected error downloading {minio_path}: {e}")
-                        continue
-        
+
+                    etag = self._object_etags.get(minio_path)
+                    if etag:
+                        current_etags[minio_path] = etag
+                        if previous_etags.get(minio_path) == etag and local_path.exists():
+                            skipped_count += 1
+                            result.add_success(str(local_path))
+                            log.debug("Unchanged (etag match), skipping: %s", minio_path)
+                            continue
+
+                    download_tasks.append((minio_path, local_path, resource_type))
+
+        if skipped_count:
+            print(f"Skipped {skipped_count} unchanged objects from previous run")
+
+        if not download_tasks:
+            self._save_scan_state(current_etags)
+            return result
+
+        # minio-py is thread-safe, so a thread pool overlaps the per-object
+        # round-trips; workers return their warnings instead of touching the
+        # shared ProcessingResult from multiple threads.
+        max_workers = min(Constants.MAX_DOWNLOAD_WORKERS, len(download_tasks))
+        advanced_pending = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._download_single_resource, minio_path, local_path, resource_type): minio_path
+                for minio_path, local_path, resource_type in download_tasks
+            }
+            for future in concurrent.futures.as_completed(futures):
+                minio_path = futures[future]
+                try:
+                    local_path, warnings, needs_advanced_cleanup = future.result()
+                    for warning in warnings:
+                        result.add_warning(warning)
+                    if needs_advanced_cleanup:
+                        advanced_pending.append(local_path)
+                    result.add_success(str(local_path))
+                    log.debug("Downloaded: %s -> %s", minio_path, local_path)
+                except S3Error as e:
+                    result.add_failure(minio_path, f"Minio error: {e}")
+                    print(f"Failed to download {minio_path}: {e}")
+                except Exception as e:
+                    result.add_failure(minio_path, f"Unexpected error: {e}")
+                    print(f"Unexpected error downloading {minio_path}: {e}")
+
+        # Advanced cleanup is CPU-bound YAML work; run it across cores once
+        # the network-bound downloads have finished.
+        if advanced_pending:
+            self._run_advanced_cleanup(advanced_pending, result)
+
+        # Failed objects are dropped from the state so the next run retries them
+        for failed_path, _ in result.failed_files:
+            current_etags.pop(failed_path, None)
+        self._save_scan_state(current_etags)
+
         return result
+
+    def _load_scan_state(self) -> Dict[str, str]:
+        """Load the object → etag map persisted by the previous run"""
+        try:
+            with open(Constants.SCAN_STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+
+    def _save_scan_state(self, etags: Dict[str, str]) -> None:
+        """Persist the object → etag map for incremental runs"""
+        try:
+            with open(Constants.SCAN_STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(etags, f, indent=2, sort_keys=True)
+        except OSError as e:
+            log.warning("Could not persist scan state: %s", e)
+
+    def _download_single_resource(self, minio_path: str, local_path: Path, resource_type: str) -> Tuple[Path, List[str], bool]:
+        """Download one object and run categorization + metadata cleanup
+
+        Runs inside the download thread pool; returns the local path, any
+        warnings for the shared result, and whether the file still needs the
+        (CPU-bound) advanced cleanup pass that runs on the process pool.
+        """
+        warnings = []
+
+        # Fetch straight into memory: one GET feeds categorization and cleanup
+        # from the same buffer, followed by a single write — instead of
+        # fget_object to disk, a re-read for categorization and a rewrite.
+        response = self.minio_handler.minio_client.get_object(
+            self.minio_handler.bucket_name,
+            minio_path
+        )
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+        file_content = None
+        try:
+            file_content = data.decode('utf-8')
+        except Exception as e:
+            log.warning("Could not decode %s for categorization: %s", local_path.name, e)
+
+        # Clean up Kubernetes metadata
+        if self._advanced_cleaner is not None:
+            # The advanced cleaner works on files and is CPU-bound: persist the
+            # raw bytes once and defer the cleanup to the process pool, which
+            # parallelizes across cores instead of serializing under the GIL.
+            if file_content is not None:
+                self._refine_categorization(local_path.name, resource_type, file_content)
+            local_path.write_bytes(data)
+            return local_path, warnings, True
+        elif file_content is not None:
+            cleaned_content, parsed_kind = self._cleanup_k8s_metadata_content(file_content, local_path.name)
+            # Re-categorize off the kind the cleanup parse already extracted;
+            # only content that bypassed parsing pays a categorization parse
+            self._refine_categorization(local_path.name, resource_type, file_content, parsed_kind)
+            if cleaned_content is None:
+                local_path.write_bytes(data)
+                cleanup_success = False
+                needs_validation = False
+            elif cleaned_content is file_content:
+                # Unchanged content: write the original bytes; the pre-filter
+                # may have skipped parsing entirely, so still validate
+                local_path.write_bytes(data)
+                cleanup_success = True
+                needs_validation = True
+            else:
+                # Freshly dumped from a successful parse: valid by
+                # construction, no second parse needed
+                self.file_manager.safe_write_file(local_path, cleaned_content, "cleaned YAML file")
+                cleanup_success = True
+                needs_validation = False
+        else:
+            # Undecodable payload: keep the raw bytes, report cleanup failure
+            local_path.write_bytes(data)
+            cleanup_success = False
+            needs_validation = False
+
+        if not cleanup_success:
+            warnings.append(f"Cleanup failed for {local_path}, but file downloaded")
+        elif needs_validation and not self._validate_yaml_content_file(local_path):
+            warnings.append(f"YAML validation failed for {local_path} after cleanup")
+
+        return local_path, warnings, False
+
+    def _refine_categorization(self, filename: str, resource_type: str,
+                               file_content: str, parsed_kind: str = None) -> None:
+        """Log when content analysis improves on the filename-based category"""
+        try:
+            better_category = self._categorize_resource(filename, file_content, parsed_kind)
+            if better_category != resource_type:
+                log.info("Improved categorization: %s %s -> %s", filename, resource_type, better_category)
+                # Update category if needed (would require refactoring, for now just log)
+        except Exception as e:
+            log.warning("Could not re-categorize %s: %s", filename, e)
+
+    def _run_advanced_cleanup(self, paths: List[Path], result: ProcessingResult) -> None:
+        """Run the advanced cleaner over downloaded files on a process pool
+
+        Each file is independent, so the parse/strip/re-emit work scales with
+        core count; every worker builds its own cleaner via the module-level
+        initializer in advanced_yaml_cleanup.
+        """
+        from advanced_yaml_cleanup import _clean_one, _init_worker_cleaner
+
+        try:
+            max_workers = min(os.cpu_count() or 1, len(paths))
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_cleaner,
+                initargs=(None,)
+            ) as executor:
+                outcomes = list(executor.map(_clean_one, paths, chunksize=16))
+        except Exception as e:
+            log.warning("Process-pool cleanup unavailable (%s); cleaning in-process", e)
+            outcomes = [self._try_advanced_cleanup(path) for path in paths]
+
+        for local_path, cleanup_success in zip(paths, outcomes):
+            if not cleanup_success:
+                # Fallback to built-in cleanup
+                log.debug("Using built-in cleanup for %s", local_path.name)
+                cleanup_success = self._builtin_cleanup_k8s_metadata(local_path)
+
+            if not cleanup_success:
+                result.add_warning(f"Cleanup failed for {local_path}, but file downloaded")
+            elif not self._validate_yaml_content_file(local_path):
+                result.add_warning(f"YAML validation failed for {local_path} after cleanup")
+
+    def _precreate_directories(self) -> None:
+        """Create the complete namespace directory tree in one pass
+
+        Collects every directory the download and generation stages touch
+        (resource dirs for the base environment, all environment overlays and
+        the argocd-apps dir per namespace) and creates them consecutively,
+        instead of sprinkling mkdir calls through the hot loops.
+        """
+        all_dirs = set()
+        for namespace in self.namespaces:
+            ns_path = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name
+            all_dirs.add(ns_path / Constants.ARGOCD_APPS_DIR)
+
+            for env in self.environments:
+                all_dirs.add(ns_path / Constants.ENVIRONMENTS_DIR / env)
+
+            base_path = ns_path / Constants.ENVIRONMENTS_DIR / self.base_env
+            for resource_type in namespace.resources:
+                all_dirs.add(base_path / resource_type)
+
+        # Sorted order keeps consecutive mkdirs within the same parent
+        for directory in sorted(all_dirs):
+            directory.mkdir(parents=True, exist_ok=True)
     
     def _cleanup_k8s_metadata(self, file_path: Path) -> bool:
         """Remove Kubernetes-generated metadata from YAML files with unified approach"""
@@ -1545,7 +1915,7 @@ class MinioGitOpsGenerator:
                 return True
             
             # Fallback to built-in cleanup
-            print(f"🔄 Using built-in cleanup for {file_path.name}")
+            log.debug("Using built-in cleanup for %s", file_path.name)
             return self._builtin_cleanup_k8s_metadata(file_path)
                 
         except Exception as e:
@@ -1554,23 +1924,22 @@ class MinioGitOpsGenerator:
     
     def _try_advanced_cleanup(self, file_path: Path) -> bool:
         """Try using the advanced YAML cleaner"""
+        if self._advanced_cleaner is None:
+            log.debug("Advanced cleaner not available for %s", file_path.name)
+            return False
+
         try:
-            from advanced_yaml_cleanup import KubernetesYAMLCleaner
-            cleaner = KubernetesYAMLCleaner()
-            success = cleaner.clean_yaml_file(file_path)
-            
+            success = self._advanced_cleaner.clean_yaml_file(file_path)
+
             if success:
-                print(f"Advanced cleanup completed: {file_path.name}")
+                log.debug("Advanced cleanup completed: %s", file_path.name)
                 return True
             else:
-                print(f"Advanced cleanup reported failure for: {file_path.name}")
+                log.warning("Advanced cleanup reported failure for: %s", file_path.name)
                 return False
-                
-        except ImportError:
-            print(f"Advanced cleaner not available for {file_path.name}")
-            return False
+
         except Exception as e:
-            print(f"Advanced cleanup error for {file_path.name}: {e}")
+            log.warning("Advanced cleanup error for %s: %s", file_path.name, e)
             return False
             
     def _builtin_cleanup_k8s_metadata(self, file_path: Path) -> bool:
@@ -1578,52 +1947,114 @@ class MinioGitOpsGenerator:
         try:
             # Use safe file reading
             content = self._safe_read_file(file_path, "YAML file for cleanup")
-            docs = list(yaml.safe_load_all(content))
-            
+
+            # Already clean: skip both the round-trip and the rewrite
+            if not any(key in content for key in _CLEANUP_TARGET_KEYS):
+                return True
+
+            cleaned_content, _ = self._cleanup_k8s_metadata_content(content, str(file_path))
+            if cleaned_content is None:
+                return False
+
+            # Unchanged content: the file on disk is already what we would
+            # write, so skip the rewrite
+            if cleaned_content is content:
+                return True
+
+            # Use safe file writing
+            self.file_manager.safe_write_file(file_path, cleaned_content, "cleaned YAML file")
+
+            return True
+
+        except Exception as e:
+            print(f"Warning: Could not clean metadata from {file_path}: {e}")
+            return False
+
+    def _cleanup_k8s_metadata_content(self, content: str, source_name: str) -> Tuple[str, str] or Tuple[None, None]:
+        """Clean Kubernetes metadata from in-memory YAML content
+
+        Shared core of the built-in cleanup: works on content that is already
+        in memory (e.g. a freshly downloaded object) so callers can clean
+        without a disk round-trip. Returns (cleaned YAML text, kind of the
+        first document) so callers can reuse the parse for categorization;
+        the kind is None when parsing was skipped, the text is None when the
+        content cannot be processed.
+        """
+        # Nothing to strip: hand the content back untouched without parsing
+        if not any(key in content for key in _CLEANUP_TARGET_KEYS):
+            return content, None
+
+        try:
+            docs = list(yaml.load_all(content, Loader=_YamlLoader))
+
             cleaned_docs = []
+            dirty = False
+            first_kind = None
             for doc in docs:
                 if not doc:
                     continue
-                
-                # Remove metadata fields that shouldn't be in GitOps
-                if 'metadata' in doc:
-                    metadata_to_remove = [
-                        'uid', 'resourceVersion', 'generation', 'creationTimestamp',
-                        'managedFields', 'selfLink', 'finalizers', 'ownerReferences'
-                    ]
-                    for field in metadata_to_remove:
-                        doc['metadata'].pop(field, None)
-                
+
+                # Remove metadata fields that shouldn't be in GitOps.
+                # Set-intersection finds the keys to strip in one C-level
+                # pass instead of probing for each candidate individually.
+                metadata = doc.get('metadata')
+                if metadata:
+                    for field in _METADATA_STRIP & metadata.keys():
+                        del metadata[field]
+                        dirty = True
+
                 # Remove status section (COMPREHENSIVE)
-                doc.pop('status', None)
-                
+                if 'status' in doc:
+                    del doc['status']
+                    dirty = True
+
                 # Resource-specific cleanup
                 kind = doc.get('kind', '')
+                if first_kind is None and kind:
+                    first_kind = kind
                 if kind == 'Service' and 'spec' in doc:
-                    doc['spec'].pop('clusterIP', None)
-                    doc['spec'].pop('clusterIPs', None)
+                    for field in ('clusterIP', 'clusterIPs'):
+                        if field in doc['spec']:
+                            del doc['spec'][field]
+                            dirty = True
                 elif kind == 'PersistentVolumeClaim' and 'spec' in doc:
-                    doc['spec'].pop('volumeName', None)
-                
+                    if 'volumeName' in doc['spec']:
+                        del doc['spec']['volumeName']
+                        dirty = True
+
                 cleaned_docs.append(doc)
-            
-            # Use safe file writing
-            cleaned_content = yaml.dump_all(cleaned_docs, default_flow_style=False, sort_keys=False)
-            self.file_manager.safe_write_file(file_path, cleaned_content, "cleaned YAML file")
-            
-            return True
-                
+
+            # The substring pre-filter can match outside the stripped
+            # positions (e.g. 'status:' under data); when nothing was
+            # actually removed, hand back the original so callers can
+            # skip the rewrite.
+            if not dirty:
+                return content, first_kind
+
+            return yaml.dump_all(cleaned_docs, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False), first_kind
+
         except Exception as e:
-            print(f"Warning: Could not clean metadata from {file_path}: {e}")
-            return False
+            print(f"Warning: Could not clean metadata from {source_name}: {e}")
+            return None, None
     
     def generate_gitops_structure(self) -> None:
         """Generate complete GitOps structure for all namespaces"""
         print("Generating GitOps structure...")
-        
-        for namespace in self.namespaces:
-            self._generate_namespace_structure(namespace)
-        
+
+        # Idempotent; covers standalone runs where download_resources was skipped
+        self._precreate_directories()
+
+        # Namespaces write to disjoint subtrees, so their generation can run
+        # concurrently; the stage is dominated by many small file writes.
+        if len(self.namespaces) > 1:
+            max_workers = min(Constants.MAX_SCAN_WORKERS, len(self.namespaces))
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Surface worker exceptions by consuming the results
+                list(executor.map(self._generate_namespace_structure, self.namespaces))
+        else:
+            for namespace in self.namespaces:
+                self._generate_namespace_structure(namespace)
+
         # Generate root README
         self._generate_root_readme()
         
@@ -1632,92 +2063,59 @@ class MinioGitOpsGenerator:
     def _generate_namespace_structure(self, namespace: NamespaceConfig) -> None:
         """Generate complete structure for a single namespace"""
         print(f"Generating structure for namespace: {namespace.name}")
-        
-        # Create directory structure
+
+        # Directory tree already exists via _precreate_directories().
+        # The namespace root is built once here and threaded through the
+        # sub-generators instead of each re-parsing the same path string.
         ns_path = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name
-        (ns_path / Constants.ARGOCD_APPS_DIR).mkdir(parents=True, exist_ok=True)
-        
-        for env in self.environments:
-            (ns_path / Constants.ENVIRONMENTS_DIR / env).mkdir(parents=True, exist_ok=True)
-        
+
         # Generate ArgoCD Applications
-        self._generate_argocd_apps(namespace)
-        
+        self._generate_argocd_apps(namespace, ns_path)
+
         # Generate Kustomizations
-        self._generate_kustomizations(namespace)
-        
+        self._generate_kustomizations(namespace, ns_path)
+
         # Generate namespace README
-        self._generate_namespace_readme(namespace)
+        self._generate_namespace_readme(namespace, ns_path)
     
-    def _generate_argocd_apps(self, namespace: NamespaceConfig) -> None:
+    def _generate_argocd_apps(self, namespace: NamespaceConfig, ns_path: Path) -> None:
         """Generate ArgoCD Application manifests for all environments"""
-        apps_path = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name / Constants.ARGOCD_APPS_DIR
-        
-        # CONSISTENT NAMING: Every environment gets its own namespace suffix
-        environments = {}
+        apps_path = ns_path / Constants.ARGOCD_APPS_DIR
+
+        # Build every manifest first, then emit them back-to-back so the
+        # template rendering and the write syscalls batch instead of
+        # interleaving per environment.
+        pending = []
         for env in self.environments:
             # Get cluster mapping for this environment
             cluster = getattr(namespace.cluster_mapping, env)
-            
+
             # Get environment-specific configuration from config.yaml
             env_config = self._get_environment_config(env)
             is_automated = env_config['sync_policy'] == 'automated'
-            
-            sync_policy = {
-                'automated': {
-                    'prune': is_automated, 
-                    'selfHeal': is_automated
-                }
-            }
-            
-            environments[env] = {
-                'cluster': cluster,
-                'target_namespace': f"{namespace.name}-{env}",
-                'sync_policy': sync_policy
-            }
-        
-        for env, config in environments.items():
-            app_manifest = {
-                'apiVersion': 'argoproj.io/v1alpha1',
-                'kind': 'Application',
-                'metadata': {
-                    'name': f"{namespace.name}-{env}",
-                    'namespace': 'argocd',
-                    'labels': {
-                        'namespace': namespace.name,
-                        'environment': env
-                    }
-                },
-                'spec': {
-                    'project': 'default',
-                    'source': {
-                        'repoURL': self.git_repo,
-                        'targetRevision': 'main',
-                        'path': f"namespaces/{namespace.name}/environments/{env}"
-                    },
-                    'destination': {
-                        'server': config['cluster'],
-                        'namespace': config['target_namespace']
-                    },
-                    'syncPolicy': {
-                        **config['sync_policy'],
-                        'syncOptions': ['CreateNamespace=true']
-                    },
-                    'info': [
-                        {'name': 'Environment', 'value': env.title()},
-                        {'name': 'Target Cluster', 'value': config['cluster']},
-                        {'name': 'Namespace', 'value': config['target_namespace']}
-                    ]
-                }
-            }
-            
-            app_file = apps_path / f"{env}.yaml"
-            content = yaml.dump(app_manifest, default_flow_style=False, sort_keys=False)
+
+            # CONSISTENT NAMING: Every environment gets its own namespace suffix
+            target_namespace = f"{namespace.name}-{env}"
+
+            content = _ARGOCD_APP_TEMPLATE.format(
+                name=f"{namespace.name}-{env}",
+                namespace=namespace.name,
+                env=env,
+                env_title=env.title(),
+                repo_url=self.git_repo,
+                cluster=cluster,
+                target_namespace=target_namespace,
+                automated='true' if is_automated else 'false'
+            )
+
+            pending.append((env, apps_path / f"{env}.yaml", content))
+
+        for env, app_file, content in pending:
             self.file_manager.safe_write_file(app_file, content, f"ArgoCD App for {env}")
-            
-            print(f"Generated ArgoCD App: {app_file}")
+
+            log.debug("Generated ArgoCD App: %s", app_file)
     
-    def _detect_pvc_storage_requirements(self, namespace: NamespaceConfig) -> Dict[str, Dict[str, str]]:
+    def _detect_pvc_storage_requirements(self, namespace: NamespaceConfig, ns_path: Path) -> Dict[str, Dict[str, str]]:
         """Dynamically detect PVC storage requirements from namespace resources"""
         storage_configs = {
             'test': {},
@@ -1730,7 +2128,7 @@ class MinioGitOpsGenerator:
             return storage_configs
         
         # Scan actual PVC files to extract names and base storage sizes
-        pvc_dir = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name / Constants.ENVIRONMENTS_DIR / self.base_env / "persistentvolumeclaims"
+        pvc_dir = ns_path / Constants.ENVIRONMENTS_DIR / self.base_env / "persistentvolumeclaims"
         if not pvc_dir.exists():
             return storage_configs
         
@@ -1739,7 +2137,7 @@ class MinioGitOpsGenerator:
             try:
                 # Use safe file reading for PVC files
                 content = self._safe_read_file(pvc_file, "PVC file")
-                docs = list(yaml.safe_load_all(content))
+                docs = list(yaml.load_all(content, Loader=_YamlLoader))
                 for doc in docs:
                         if doc and doc.get('kind') == 'PersistentVolumeClaim':
                             pvc_name = self._safe_get_pvc_name(doc, pvc_file.stem)
@@ -1812,16 +2210,16 @@ class MinioGitOpsGenerator:
         except (AttributeError, TypeError, KeyError):
             return Constants.DEFAULT_STORAGE_TEST
 
-    def _generate_kustomizations(self, namespace: NamespaceConfig) -> None:
+    def _generate_kustomizations(self, namespace: NamespaceConfig, ns_path: Path) -> None:
         """Generate Kustomization files for all environments"""
-        
+
         # Generate base kustomization
-        self._generate_base_kustomization(namespace)
-        
+        self._generate_base_kustomization(namespace, ns_path)
+
         # Generate environment overlays
-        self._generate_environment_overlays(namespace)
-    
-    def _generate_base_kustomization(self, namespace: NamespaceConfig) -> None:
+        self._generate_environment_overlays(namespace, ns_path)
+
+    def _generate_base_kustomization(self, namespace: NamespaceConfig, ns_path: Path) -> None:
         """Generate base kustomization file for the base environment"""
         base_kustomization = {
             'apiVersion': 'kustomize.config.k8s.io/v1beta1',
@@ -1836,23 +2234,23 @@ class MinioGitOpsGenerator:
             }
         }
         
-        base_file = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name / Constants.ENVIRONMENTS_DIR / self.base_env / "kustomization.yaml"
+        base_file = ns_path / Constants.ENVIRONMENTS_DIR / self.base_env / "kustomization.yaml"
         
         # Use safe file writing
-        content = yaml.dump(base_kustomization, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(base_kustomization, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         self.file_manager.safe_write_file(base_file, content, "base Kustomization")
     
-    def _generate_environment_overlays(self, namespace: NamespaceConfig) -> None:
+    def _generate_environment_overlays(self, namespace: NamespaceConfig, ns_path: Path) -> None:
         """Generate environment overlay kustomizations"""
         # Dynamically detect storage requirements
-        dynamic_storage = self._detect_pvc_storage_requirements(namespace)
-        
+        dynamic_storage = self._detect_pvc_storage_requirements(namespace, ns_path)
+
         # Generate overlays for non-base environments
         overlay_envs = [env for env in self.environments if env != self.base_env]
-        
+
         for env in overlay_envs:
             overlay_config = self._create_overlay_config(namespace, env, dynamic_storage)
-            self._generate_single_overlay(namespace, env, overlay_config)
+            self._generate_single_overlay(namespace, env, overlay_config, ns_path)
     
     def _create_overlay_config(self, namespace: NamespaceConfig, env: str, dynamic_storage: dict) -> dict:
         """Create configuration for a single environment overlay"""
@@ -1867,7 +2265,7 @@ class MinioGitOpsGenerator:
             'storage_patches': dynamic_storage.get(env, {})
         }
     
-    def _generate_single_overlay(self, namespace: NamespaceConfig, env: str, config: dict) -> None:
+    def _generate_single_overlay(self, namespace: NamespaceConfig, env: str, config: dict, ns_path: Path) -> None:
         """Generate a single environment overlay kustomization"""
         overlay_kustomization = {
             'apiVersion': 'kustomize.config.k8s.io/v1beta1',
@@ -1890,10 +2288,10 @@ class MinioGitOpsGenerator:
         if patches:
             overlay_kustomization['patches'] = patches
         
-        overlay_file = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name / Constants.ENVIRONMENTS_DIR / env / "kustomization.yaml"
+        overlay_file = ns_path / Constants.ENVIRONMENTS_DIR / env / "kustomization.yaml"
         
         # Use safe file writing
-        content = yaml.dump(overlay_kustomization, default_flow_style=False, sort_keys=False)
+        content = yaml.dump(overlay_kustomization, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         self.file_manager.safe_write_file(overlay_file, content, f"{env} environment Kustomization")
     
     def _create_environment_patches(self, namespace: NamespaceConfig, env: str, config: dict) -> list:
@@ -1904,29 +2302,22 @@ class MinioGitOpsGenerator:
         if 'deployments' in namespace.resources:
             patches.append({
                 'target': {'kind': 'Deployment', 'name': '.*'},
-                'patch': f'''- op: replace
-  path: /spec/replicas
-  value: {config['replicas']}
-- op: add
-  path: /spec/template/spec/containers/0/env/-
-  value:
-    name: ENVIRONMENT
-    value: "{env}"'''
+                'patch': _REPLICA_PATCH_TEMPLATE.format(replicas=config['replicas'], env=env)
             })
-        
-        # Storage patches
+
+        # Storage patches: each JSON6902 patch applies to a single target
+        # resource and PVC sizes differ, so these cannot be merged into one
+        # multi-target entry.
         if 'persistentvolumeclaims' in namespace.resources:
             for pvc_name, size in config['storage_patches'].items():
                 patches.append({
                     'target': {'kind': 'PersistentVolumeClaim', 'name': pvc_name},
-                    'patch': f'''- op: replace
-  path: /spec/resources/requests/storage
-  value: "{size}"'''
+                    'patch': _STORAGE_PATCH_TEMPLATE.format(size=size)
                 })
-        
+
         return patches
     
-    def _generate_namespace_readme(self, namespace: NamespaceConfig) -> None:
+    def _generate_namespace_readme(self, namespace: NamespaceConfig, ns_path: Path) -> None:
         """Generate README for namespace with deployment instructions"""
         
         # Count resources
@@ -1993,7 +2384,7 @@ kubectl get all,pvc,routes,configmaps -n {namespace.name}
 *Generated automatically from Minio bucket by minio-to-gitops.py*
 """
         
-        readme_file = Path(Constants.BASE_NAMESPACE_DIR) / namespace.name / "README.md"
+        readme_file = ns_path / "README.md"
         
         # Use safe file writing
         self.file_manager.safe_write_file(readme_file, readme_content, "namespace README")
@@ -2344,7 +2735,9 @@ def create_backup(backup_name=None):
 
 def main():
     """Main function to run the Minio to GitOps generator"""
-    
+    # Per-file messages sit at DEBUG; LOGLEVEL=DEBUG restores the old verbosity
+    logging.basicConfig(level=os.environ.get('LOGLEVEL', 'INFO'), format='%(message)s')
+
     try:
         # Load configuration from file
         print("Loading configuration...")
@@ -2373,7 +2766,7 @@ def main():
             # Step 1: Scan Minio bucket to detect namespaces and resources
             print("\nStep 1: Scanning Minio bucket...")
             namespaces, scan_result = generator.scan_minio_bucket()
-            overall_result.success_files.extend(scan_result.success_files)
+            overall_result.success_count += scan_result.success_count
             overall_result.failed_files.extend(scan_result.failed_files)
             overall_result.warnings.extend(scan_result.warnings)
         